@@ -0,0 +1,29 @@
+"""Shared pytest configuration for the posix_hardening_ssh Molecule tests."""
+
+import pytest
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Assign every test an xdist group for ``--dist=loadgroup``.
+
+    Tests marked ``serial`` observe live service and socket state, so they
+    all share one group and run one after another on a single worker. The
+    read-only tests are grouped by class (or module for plain functions),
+    like ``--dist=loadscope``, so module-scoped fixtures such as
+    ``sshd_config`` are fetched once per worker instead of once per test.
+
+    Runs before xdist's own hook, which turns the group into a nodeid
+    suffix. Does nothing when xdist is not distributing by group, so plain
+    ``pytest`` runs do not trip ``--strict-markers``.
+    """
+    # xdist workers collect with dist reset to "no" and record the
+    # requested mode in the loadgroup option instead
+    if not config.getoption("loadgroup", False):
+        return
+    for item in items:
+        if item.get_closest_marker("serial"):
+            group = "serial"
+        else:
+            group = item.nodeid.split("[", 1)[0].rsplit("::", 1)[0]
+        item.add_marker(pytest.mark.xdist_group(group))
@@ -0,0 +1,91 @@
+"""Checks for the xdist grouping hook in conftest.py.
+
+These run locally without a Molecule instance:
+
+    pytest molecule/default/test_conftest.py
+"""
+
+from pathlib import Path
+
+import pytest
+
+pytest_plugins = ["pytester"]
+
+SCENARIO_DIR = Path(__file__).parent
+
+SAMPLE_TESTS = """
+import pytest
+
+
+class TestReadOnly:
+    def test_a(self):
+        pass
+
+    def test_b(self):
+        pass
+
+
+class TestService:
+    @pytest.mark.serial
+    def test_running(self):
+        pass
+
+    @pytest.mark.serial
+    def test_enabled(self):
+        pass
+
+    @pytest.mark.serial
+    @pytest.mark.parametrize("port", [22, 2222])
+    def test_listening(self, port):
+        pass
+"""
+
+
+@pytest.fixture
+def scenario(pytester):
+    """Copy the scenario pytest.ini and conftest.py next to sample tests."""
+    for name in ("pytest.ini", "conftest.py"):
+        pytester.makefile(
+            Path(name).suffix, **{Path(name).stem: (SCENARIO_DIR / name).read_text()}
+        )
+    pytester.makepyfile(test_sample=SAMPLE_TESTS)
+    return pytester
+
+
+def _workers(result):
+    """Map each reported nodeid to the xdist worker that ran it."""
+    workers = {}
+    for line in result.outlines:
+        if line.startswith("[gw") and " PASSED " in line:
+            fields = line.split()
+            workers[fields[-1]] = fields[0].strip("[]")
+    return workers
+
+
+def test_serial_tests_share_one_worker(scenario):
+    pytest.importorskip("xdist")
+    result = scenario.runpytest("-n", "4", "--dist=loadgroup")
+    result.assert_outcomes(passed=6)
+
+    workers = _workers(result)
+    serial = {node: w for node, w in workers.items() if node.endswith("@serial")}
+    assert len(serial) == 4
+    assert len(set(serial.values())) == 1
+
+
+def test_read_only_tests_grouped_by_class(scenario):
+    pytest.importorskip("xdist")
+    result = scenario.runpytest("-n", "4", "--dist=loadgroup")
+
+    workers = _workers(result)
+    read_only = {
+        node: w for node, w in workers.items() if "TestReadOnly" in node
+    }
+    assert len(read_only) == 2
+    assert all(node.endswith("@test_sample.py::TestReadOnly") for node in read_only)
+    assert len(set(read_only.values())) == 1
+
+
+def test_no_groups_without_xdist(scenario):
+    result = scenario.runpytest("-p", "no:xdist")
+    result.assert_outcomes(passed=6)